@@ -649,6 +649,37 @@ impl TextCanvas {
         }
     }
 
+    /// Set the state of multiple screen pixels at once.
+    ///
+    /// This is equivalent to calling [`set_pixel()`](TextCanvas::set_pixel)
+    /// for each pair of coordinates.
+    ///
+    /// Note: Coordinates outside the screen bounds are ignored.
+    ///
+    /// # Arguments
+    ///
+    /// - `xs` - Screen Xs (high resolution).
+    /// - `ys` - Screen Ys (high resolution), paired with `xs`. Extra
+    ///   coordinates in the longest of the two are ignored.
+    /// - `state` - `true` means _on_, `false` means _off_.
+    ///
+    /// # Examples
+    ///
+    /// ```rust
+    /// use textcanvas::TextCanvas;
+    ///
+    /// let mut canvas = TextCanvas::new(3, 1);
+    ///
+    /// canvas.set_pixels(&[0, 1, 2, 3, 4, 5], &[0, 1, 2, 3, 2, 1], true);
+    ///
+    /// assert_eq!(canvas.to_string(), "⠑⢄⠔\n");
+    /// ```
+    pub fn set_pixels(&mut self, xs: &[i32], ys: &[i32], state: bool) {
+        for (&x, &y) in xs.iter().zip(ys) {
+            self.set_pixel(x, y, state);
+        }
+    }
+
     fn color_pixel(&mut self, x: usize, y: usize) {
         self.color_buffer[y / 4][x / 2] = self.color.clone();
     }
@@ -862,6 +893,52 @@ impl TextCanvas {
         self.bresenham_line(x1, y1, x2, y2);
     }
 
+    /// Stroke lines joining consecutive points.
+    ///
+    /// This is equivalent to calling
+    /// [`stroke_line()`](TextCanvas::stroke_line) for each pair of
+    /// consecutive points, in a single call.
+    ///
+    /// # Arguments
+    ///
+    /// - `xs` - Screen Xs (high resolution).
+    /// - `ys` - Screen Ys (high resolution), paired with `xs`. Extra
+    ///   coordinates in the longest of the two are ignored.
+    ///
+    /// # Examples
+    ///
+    /// ```rust
+    /// use textcanvas::TextCanvas;
+    ///
+    /// let mut canvas = TextCanvas::new(15, 5);
+    ///
+    /// canvas.stroke_polyline(&[0, 10, 20, 29], &[19, 0, 19, 0]);
+    ///
+    /// assert_eq!(
+    ///     canvas.to_string(),
+    ///     "\
+    /// ⠀⠀⠀⠀⡰⠱⡀⠀⠀⠀⠀⠀⠀⠀⡜
+    /// ⠀⠀⠀⡰⠁⠀⠱⡀⠀⠀⠀⠀⠀⡜⠀
+    /// ⠀⠀⡰⠁⠀⠀⠀⠱⡀⠀⠀⠀⡜⠀⠀
+    /// ⠀⡰⠁⠀⠀⠀⠀⠀⠱⡀⠀⡜⠀⠀⠀
+    /// ⡰⠁⠀⠀⠀⠀⠀⠀⠀⠱⡜⠀⠀⠀⠀
+    /// "
+    /// );
+    /// ```
+    pub fn stroke_polyline(&mut self, xs: &[i32], ys: &[i32]) {
+        let mut points = xs.iter().copied().zip(ys.iter().copied());
+        let Some((mut previous_x, mut previous_y)) = points.next() else {
+            return;
+        };
+        // A lone point is a line of length zero.
+        self.set_pixel(previous_x, previous_y, true);
+
+        for (x, y) in points {
+            self.bresenham_line(previous_x, previous_y, x, y);
+            (previous_x, previous_y) = (x, y);
+        }
+    }
+
     /// Stroke line using Bresenham's line algorithm.
     fn bresenham_line(&mut self, mut x1: i32, mut y1: i32, x2: i32, y2: i32) {
         let dx = (x2 - x1).abs();
@@ -1875,6 +1952,43 @@ mod tests {
         );
     }
 
+    #[test]
+    fn set_pixels() {
+        let mut canvas = TextCanvas::new(3, 2);
+
+        let xs: Vec<i32> = (0..canvas.screen.width()).collect();
+        let ys: Vec<i32> = (0..canvas.screen.height()).collect();
+        canvas.set_pixels(&xs, &ys, true);
+
+        let mut reference = TextCanvas::new(3, 2);
+        stroke_line_accros_canvas(&mut reference);
+
+        assert_eq!(canvas.buffer, reference.buffer, "Incorrect buffer content.");
+    }
+
+    #[test]
+    fn set_pixels_with_overflow() {
+        let mut canvas = TextCanvas::new(1, 1);
+
+        let (width, height) = (canvas.screen.width(), canvas.screen.height());
+        canvas.set_pixels(
+            &[-1, 0, -1, width, 0, width],
+            &[0, -1, -1, 0, height, height],
+            true,
+        );
+
+        assert_eq!(
+            canvas.buffer,
+            [
+                [false, false],
+                [false, false],
+                [false, false],
+                [false, false],
+            ],
+            "No pixel should be turned on.",
+        );
+    }
+
     #[test]
     fn get_as_string() {
         let mut canvas = TextCanvas::new(3, 2);
@@ -2603,6 +2717,44 @@ mod tests {
         );
     }
 
+    #[test]
+    fn stroke_polyline() {
+        let mut canvas = TextCanvas::new(15, 5);
+        let mut expected = TextCanvas::new(15, 5);
+
+        let points = [(0, 0), (29, 19), (29, 19), (0, 19), (15, 5)];
+        let (xs, ys): (Vec<i32>, Vec<i32>) = points.iter().copied().unzip();
+        canvas.stroke_polyline(&xs, &ys);
+        for pair in points.windows(2) {
+            let ((x1, y1), (x2, y2)) = (pair[0], pair[1]);
+            expected.stroke_line(x1, y1, x2, y2);
+        }
+
+        assert_eq!(
+            canvas.to_string(),
+            expected.to_string(),
+            "Polyline not drawn like consecutive lines.",
+        );
+    }
+
+    #[test]
+    fn stroke_polyline_single_point() {
+        let mut canvas = TextCanvas::new(3, 1);
+
+        canvas.stroke_polyline(&[1], &[1]);
+
+        assert_eq!(canvas.to_string(), "⠐⠀⠀\n", "Point not drawn.");
+    }
+
+    #[test]
+    fn stroke_polyline_no_points() {
+        let mut canvas = TextCanvas::new(3, 1);
+
+        canvas.stroke_polyline(&[], &[]);
+
+        assert_eq!(canvas.to_string(), "⠀⠀⠀\n", "Canvas not empty.");
+    }
+
     #[test]
     fn stroke_line_from_outside_to_outside() {
         let mut canvas = TextCanvas::new(15, 5);
@@ -1,3 +1,4 @@
+import array
 import doctest
 import math
 import unittest
@@ -393,6 +394,29 @@ class TestPlot(unittest.TestCase):
             29, Plot.compute_screen_x_of_function(canvas, 10.0, -10.0, 10.0, f)
         )
 
+    def test_compute_screen_x_of_function_with_reversed_bounds(self) -> None:
+        canvas = TextCanvas(15, 5)
+
+        def f(x: float) -> float:
+            return x
+
+        for value in (-10.0, 0.0, 10.0):
+            with self.subTest(value=value):
+                self.assertEqual(
+                    Plot.compute_screen_x_of_function(canvas, value, -10.0, 10.0, f),
+                    Plot.compute_screen_x_of_function(canvas, value, 10.0, -10.0, f),
+                )
+
+    def test_compute_screen_x_of_function_does_not_compute_function(self) -> None:
+        canvas = TextCanvas(15, 5)
+
+        def f(x: float) -> float:
+            raise AssertionError("Function computed.")
+
+        self.assertEqual(
+            14, Plot.compute_screen_x_of_function(canvas, 0.0, -10.0, 10.0, f)
+        )
+
     def test_compute_screen_x_of_function_range_0(self) -> None:
         canvas = TextCanvas(15, 5)
 
@@ -662,6 +686,26 @@ class TestPlot(unittest.TestCase):
             "⡠⠤⠒⠊⠉⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀\n",
         )
 
+    def test_plot_line_with_many_points_on_the_same_pixels(self) -> None:
+        canvas = TextCanvas(3, 1)
+
+        x: list[float] = [float(i) for i in range(1001)]
+        y: list[float] = [float(i) for i in range(1001)]
+
+        Plot.line(canvas, x, y)
+
+        self.assertEqual(canvas.to_string(), "⡴⠚⠉\n")
+
+    def test_plot_scatter_with_many_points_on_the_same_pixels(self) -> None:
+        canvas = TextCanvas(3, 1)
+
+        x: list[float] = [float(i) for i in range(1001)]
+        y: list[float] = [float(i) for i in range(1001)]
+
+        Plot.scatter(canvas, x, y)
+
+        self.assertEqual(canvas.to_string(), "⡴⠚⠉\n")
+
     def test_plot_scatter(self) -> None:
         canvas = TextCanvas(15, 5)
 
@@ -1030,6 +1074,15 @@ class TestChart(unittest.TestCase):
             "⠀⠀⠀⠀⠀⠀⠀⠀-5⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀5\n",
         )
 
+    def test_chart_line_with_other_sequences(self) -> None:
+        canvas_list = TextCanvas(35, 10)
+        canvas_other = TextCanvas(35, 10)
+
+        Chart.line(canvas_list, list(range(-5, 6)), list(range(-5, 6)))
+        Chart.line(canvas_other, tuple(range(-5, 6)), array.array("d", range(-5, 6)))
+
+        self.assertEqual(canvas_other.to_string(), canvas_list.to_string())
+
     def test_chart_scatter(self) -> None:
         canvas = TextCanvas(35, 10)
 
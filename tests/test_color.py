@@ -26,6 +26,33 @@ class TestColor(unittest.TestCase):
 
         self.assertEqual(string, "\x1b[0;35m{}\x1b[0m")
 
+    def test_to_string_after_changing_color(self) -> None:
+        color = Color()
+        steps = [
+            ("bold", color.bold, "\x1b[1m{}\x1b[0m"),
+            ("italic", color.italic, "\x1b[1;3m{}\x1b[0m"),
+            ("underline", color.underline, "\x1b[1;3;4m{}\x1b[0m"),
+            ("red", color.red, "\x1b[1;3;4;31m{}\x1b[0m"),
+            ("bg_green", color.bg_green, "\x1b[1;3;4;31;42m{}\x1b[0m"),
+            ("x_red_1", color.x_red_1, "\x1b[1;3;4;38;5;196m{}\x1b[0m"),
+            (
+                "bg_x_red_1",
+                color.bg_x_red_1,
+                "\x1b[1;3;4;38;5;196m\x1b[48;5;196m{}\x1b[0m",
+            ),
+            ("rgb", lambda: color.rgb(1, 2, 3), "\x1b[1;3;4;38;2;1;2;3m{}\x1b[0m"),
+            (
+                "bg_rgb",
+                lambda: color.bg_rgb(4, 5, 6),
+                "\x1b[1;3;4;38;2;1;2;3m\x1b[48;2;4;5;6m{}\x1b[0m",
+            ),
+        ]
+
+        for name, change, expected in steps:
+            with self.subTest(name=name):
+                change()
+                self.assertEqual(color.to_string(), expected)
+
     # Special Cases.
 
     def test_no_color(self) -> None:
@@ -299,6 +299,54 @@ class TestTextCanvas(unittest.TestCase):
             "Incorrect buffer content.",
         )
 
+    def test_set_pixels(self) -> None:
+        canvas = TextCanvas(3, 2)
+
+        canvas.set_pixels(range(canvas.screen.width), range(canvas.screen.height), True)
+
+        reference = TextCanvas(3, 2)
+        stroke_line_accros_canvas(reference)
+
+        self.assertEqual(canvas.buffer, reference.buffer, "Incorrect buffer content.")
+
+    def test_set_pixels_with_overflow(self) -> None:
+        canvas = TextCanvas(1, 1)
+
+        canvas.set_pixels(
+            [-1, 0, -1, canvas.screen.width, 0, canvas.screen.width],
+            [0, -1, -1, 0, canvas.screen.height, canvas.screen.height],
+            True,
+        )
+
+        self.assertEqual(
+            canvas.buffer,
+            [
+                [False, False],
+                [False, False],
+                [False, False],
+                [False, False],
+            ],
+            "No pixel should be turned on.",
+        )
+
+    def test_set_pixels_inverted(self) -> None:
+        canvas = TextCanvas(1, 1)
+        canvas.fill()
+
+        canvas.invert()
+        canvas.set_pixels([0, 1], [0, 3], True)
+
+        self.assertEqual(
+            canvas.buffer,
+            [
+                [False, True],
+                [True, True],
+                [True, True],
+                [True, False],
+            ],
+            "Incorrect buffer content.",
+        )
+
     def test_get_as_string(self) -> None:
         canvas = TextCanvas(3, 2)
         stroke_line_accros_canvas(canvas)
@@ -308,36 +356,36 @@ class TestTextCanvas(unittest.TestCase):
     def test_clear(self) -> None:
         canvas = TextCanvas(2, 2)
 
-        canvas.fill()
+        # Only the effect of `clear()` matters, set pixels directly.
+        canvas.buffer = [
+            [True] * canvas.screen.width for _ in range(canvas.screen.height)
+        ]
 
         canvas.clear()
 
         self.assertEqual(canvas.to_string(), "⠀⠀\n⠀⠀\n", "Output not empty.")
 
-    def test_clear_edits_buffer_in_place(self) -> None:
+    def test_clear_edits_buffers_in_place(self) -> None:
         canvas = TextCanvas(1, 1)
+        canvas.set_color(Color().bright_red())
+        canvas.draw_text("h", 0, 0)
 
-        buffer = canvas.buffer
-        row_0 = canvas.buffer[0]
-        row_1 = canvas.buffer[1]
-        row_2 = canvas.buffer[2]
-        row_3 = canvas.buffer[3]
+        buffers = ("buffer", "color_buffer", "text_buffer")
+        before = {name: getattr(canvas, name) for name in buffers}
+        rows_before = {name: list(getattr(canvas, name)) for name in buffers}
 
         canvas.clear()
 
-        self.assertIs(buffer, canvas.buffer, "Container should be the same as before.")
-        self.assertIs(
-            row_0, canvas.buffer[0], "Container should be the same as before."
-        )
-        self.assertIs(
-            row_1, canvas.buffer[1], "Container should be the same as before."
-        )
-        self.assertIs(
-            row_2, canvas.buffer[2], "Container should be the same as before."
-        )
-        self.assertIs(
-            row_3, canvas.buffer[3], "Container should be the same as before."
-        )
+        for name in buffers:
+            with self.subTest(name=name):
+                buffer = getattr(canvas, name)
+                self.assertIs(
+                    before[name], buffer, "Container should be the same as before."
+                )
+                for row_before, row in zip(rows_before[name], buffer, strict=True):
+                    self.assertIs(
+                        row_before, row, "Container should be the same as before."
+                    )
 
     def test_fill(self) -> None:
         canvas = TextCanvas(2, 2)
@@ -561,6 +609,32 @@ class TestTextCanvasColor(unittest.TestCase):
             "Incorrect color buffer.",
         )
 
+    def test_set_pixels_colors_and_decolors(self) -> None:
+        canvas = TextCanvas(2, 2)
+
+        canvas.set_color(Color().bg_bright_blue())
+        canvas.set_pixels([3, 1], [3, 5], True)
+
+        self.assertEqual(
+            canvas.color_buffer,
+            [
+                [Color(), Color().bg_bright_blue()],
+                [Color().bg_bright_blue(), Color()],
+            ],
+            "Incorrect color buffer.",
+        )
+
+        canvas.set_pixels([3], [3], False)
+
+        self.assertEqual(
+            canvas.color_buffer,
+            [
+                [Color(), Color()],
+                [Color().bg_bright_blue(), Color()],
+            ],
+            "Incorrect color buffer.",
+        )
+
     def test_get_as_string_colored(self) -> None:
         canvas = TextCanvas(3, 2)
         canvas.set_color(Color().bright_green())
@@ -601,26 +675,6 @@ class TestTextCanvasColor(unittest.TestCase):
             "Color buffer should be full of no-color.",
         )
 
-    def test_clear_edits_color_buffer_in_place(self) -> None:
-        canvas = TextCanvas(2, 2)
-        canvas.set_color(Color().bright_red())
-
-        color_buffer = canvas.color_buffer
-        row_0 = canvas.color_buffer[0]
-        row_1 = canvas.color_buffer[1]
-
-        canvas.clear()
-
-        self.assertIs(
-            color_buffer, canvas.color_buffer, "Container should be the same as before."
-        )
-        self.assertIs(
-            row_0, canvas.color_buffer[0], "Container should be the same as before."
-        )
-        self.assertIs(
-            row_1, canvas.color_buffer[1], "Container should be the same as before."
-        )
-
 
 class TestTextCanvasText(unittest.TestCase):
     def test_text_buffer_size_at_init(self) -> None:
@@ -854,26 +908,6 @@ class TestTextCanvasText(unittest.TestCase):
             "Text buffer should be full of no-colored empty chars.",
         )
 
-    def test_clear_edits_text_buffer_in_place(self) -> None:
-        canvas = TextCanvas(2, 2)
-        canvas.draw_text("hi", 0, 0)
-
-        text_buffer = canvas.text_buffer
-        row_0 = canvas.text_buffer[0]
-        row_1 = canvas.text_buffer[1]
-
-        canvas.clear()
-
-        self.assertIs(
-            text_buffer, canvas.text_buffer, "Container should be the same as before."
-        )
-        self.assertIs(
-            row_0, canvas.text_buffer[0], "Container should be the same as before."
-        )
-        self.assertIs(
-            row_1, canvas.text_buffer[1], "Container should be the same as before."
-        )
-
 
 class TestTextCanvasDrawingPrimitives(unittest.TestCase):
     def test_stroke_line(self) -> None:
@@ -923,6 +957,34 @@ class TestTextCanvasDrawingPrimitives(unittest.TestCase):
             "Line not drawn correctly.",
         )
 
+    def test_stroke_straight_lines_from_outside_to_outside(self) -> None:
+        canvas = TextCanvas(5, 2)
+
+        canvas.stroke_line(-1_000_000, 1, 1_000_000, 1)
+        canvas.stroke_line(2, 1_000_000, 2, -1_000_000)
+        canvas.stroke_line(-10, -5, -10, 5)  # Fully outside.
+
+        self.assertEqual(
+            canvas.to_string(),
+            "⠒⡗⠒⠒⠒\n⠀⡇⠀⠀⠀\n",
+            "Lines not drawn correctly.",
+        )
+
+    def test_stroke_line_fully_outside(self) -> None:
+        canvas = TextCanvas(15, 5)
+
+        far: int = 1_000_000
+        lines = {
+            "left": (-far, -far, -1, far),
+            "right": (canvas.w + 1, -far, far, far),
+            "top": (-far, -far, far, -1),
+            "bottom": (-far, canvas.h + 1, far, far),
+        }
+        for side, line in lines.items():
+            with self.subTest(side=side):
+                canvas.stroke_line(*line)
+                self.assertEqual(canvas.to_string(), TextCanvas(15, 5).to_string())
+
     def test_erase_line(self) -> None:
         canvas = TextCanvas(15, 5)
 
@@ -945,6 +1007,60 @@ class TestTextCanvasDrawingPrimitives(unittest.TestCase):
             "Line not erased correctly.",
         )
 
+    def test_stroke_polyline(self) -> None:
+        canvas = TextCanvas(15, 5)
+        expected = TextCanvas(15, 5)
+
+        points = [(0, 0), (29, 19), (29, 19), (0, 19), (15, 5)]
+        canvas.stroke_polyline(*zip(*points))
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            expected.stroke_line(x1, y1, x2, y2)
+
+        self.assertEqual(
+            canvas.to_string(),
+            expected.to_string(),
+            "Polyline not drawn like consecutive lines.",
+        )
+
+    def test_stroke_polyline_with_points_in_the_same_column(self) -> None:
+        canvas = TextCanvas(5, 3)
+        expected = TextCanvas(5, 3)
+
+        xs = [0, 0, 0, 0, 3, 3, 3, 5, 9, 9]
+        ys = [5, 2, 8, 4, 0, 11, 6, 6, 1, 10]
+        canvas.stroke_polyline(xs, ys)
+        for i in range(len(xs) - 1):
+            expected.stroke_line(xs[i], ys[i], xs[i + 1], ys[i + 1])
+
+        self.assertEqual(
+            canvas.to_string(),
+            expected.to_string(),
+            "Polyline not drawn like consecutive lines.",
+        )
+
+    def test_stroke_polyline_single_point(self) -> None:
+        canvas = TextCanvas(3, 1)
+
+        canvas.stroke_polyline([1], [1])
+
+        self.assertEqual(canvas.to_string(), "⠐⠀⠀\n", "Point not drawn.")
+
+    def test_stroke_polyline_no_points(self) -> None:
+        canvas = TextCanvas(3, 1)
+
+        canvas.stroke_polyline([], [])
+
+        self.assertEqual(canvas.to_string(), "⠀⠀⠀\n", "Canvas not empty.")
+
+    def test_erase_horizontal_line(self) -> None:
+        canvas = TextCanvas(3, 1)
+
+        canvas.fill()
+        canvas.invert()
+        canvas.stroke_line(-1, 1, 4, 1)
+
+        self.assertEqual(canvas.to_string(), "⣭⣭⣽\n", "Line not erased correctly.")
+
     def test_stroke_rect(self) -> None:
         canvas = TextCanvas(15, 5)
 
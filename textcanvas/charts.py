@@ -1,5 +1,8 @@
 import enum
-from typing import Callable
+import functools
+import itertools
+import operator
+from typing import Callable, Sequence
 
 from .textcanvas import TextCanvas
 
@@ -46,7 +49,9 @@ class Plot:
     """
 
     @staticmethod
-    def stroke_xy_axes(canvas: TextCanvas, x: list[float], y: list[float]) -> None:
+    def stroke_xy_axes(
+        canvas: TextCanvas, x: Sequence[float], y: Sequence[float]
+    ) -> None:
         """Stroke X and Y axes.
 
         If 0 is not visible on an axis, the axis will not be drawn.
@@ -77,7 +82,7 @@ class Plot:
         Plot.stroke_y_axis(canvas, x)
 
     @staticmethod
-    def stroke_x_axis(canvas: TextCanvas, y: list[float]) -> None:
+    def stroke_x_axis(canvas: TextCanvas, y: Sequence[float]) -> None:
         """Stroke X axis.
 
         See `stroke_xy_axes()` which has the same API for an example.
@@ -88,7 +93,7 @@ class Plot:
         Plot.stroke_line_at_y(canvas, 0.0, y)
 
     @staticmethod
-    def stroke_y_axis(canvas: TextCanvas, x: list[float]) -> None:
+    def stroke_y_axis(canvas: TextCanvas, x: Sequence[float]) -> None:
         """Stroke Y axis.
 
         See `stroke_xy_axes()` which has the same API for an example.
@@ -99,7 +104,7 @@ class Plot:
         Plot.stroke_line_at_x(canvas, 0.0, x)
 
     @staticmethod
-    def stroke_line_at_x(canvas: TextCanvas, value: float, x: list[float]) -> None:
+    def stroke_line_at_x(canvas: TextCanvas, value: float, x: Sequence[float]) -> None:
         """Stroke vertical line at X = value.
 
         If the value is out of the range of Y values, nothing will be
@@ -120,12 +125,22 @@ class Plot:
             ⡇⠀⠀⢸⠀⠀⠀⡇⠀⠀⢸⠀⠀⠀⢸
             ⡇⠀⠀⢸⠀⠀⠀⡇⠀⠀⢸⠀⠀⠀⢸
         """
-        if (screen_x := Plot.compute_screen_x(canvas, value, x)) is None:
+        if len(x) == 0:
             return
+
+        (min_x, max_x) = Plot._minmax(x)
+        Plot._stroke_line_at_x_in_range(canvas, value, min_x, max_x)
+
+    @staticmethod
+    def _stroke_line_at_x_in_range(
+        canvas: TextCanvas, value: float, min_x: float, max_x: float
+    ) -> None:
+        """Like `stroke_line_at_x()`, with pre-computed bounds."""
+        screen_x: int = Plot._compute_screen_x_in_range(canvas, value, min_x, max_x)
         canvas.stroke_line(screen_x, 0, screen_x, canvas.h)
 
     @staticmethod
-    def stroke_line_at_y(canvas: TextCanvas, value: float, y: list[float]) -> None:
+    def stroke_line_at_y(canvas: TextCanvas, value: float, y: Sequence[float]) -> None:
         """Stroke horizontal line at Y = value.
 
         If the value is out of the range of Y values, nothing will be
@@ -146,13 +161,23 @@ class Plot:
             ⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀
             ⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀
         """
-        if (screen_y := Plot.compute_screen_y(canvas, value, y)) is None:
+        if len(y) == 0:
             return
+
+        (min_y, max_y) = Plot._minmax(y)
+        Plot._stroke_line_at_y_in_range(canvas, value, min_y, max_y)
+
+    @staticmethod
+    def _stroke_line_at_y_in_range(
+        canvas: TextCanvas, value: float, min_y: float, max_y: float
+    ) -> None:
+        """Like `stroke_line_at_y()`, with pre-computed bounds."""
+        screen_y: int = Plot._compute_screen_y_in_range(canvas, value, min_y, max_y)
         canvas.stroke_line(0, screen_y, canvas.w, screen_y)
 
     @staticmethod
     def compute_screen_x(
-        canvas: TextCanvas, value: float, x: list[float]
+        canvas: TextCanvas, value: float, x: Sequence[float]
     ) -> int | None:
         """Compute X position of a value on the canvas.
 
@@ -170,17 +195,26 @@ class Plot:
             >>> assert 29 == Plot.compute_screen_x(canvas, 10.0, x)
             >>> assert 14 == Plot.compute_screen_x(canvas, 0.0, x)
         """
-        if not x:
+        if len(x) == 0:
             return None
 
-        min_x: float = min(x)
-        max_x: float = max(x)
+        (min_x, max_x) = Plot._minmax(x)
+        return Plot._compute_screen_x_in_range(canvas, value, min_x, max_x)
+
+    @staticmethod
+    def _compute_screen_x_in_range(
+        canvas: TextCanvas, value: float, min_x: float, max_x: float
+    ) -> int:
+        """Like `compute_screen_x()`, with pre-computed bounds.
+
+        This lets callers that already know the bounds of X avoid going
+        over the values again.
+        """
         range_x: float = max_x - min_x
 
-        try:
-            scale_x: float = canvas.w / range_x
-        except ZeroDivisionError:
+        if range_x == 0.0:
             return canvas.cx
+        scale_x: float = canvas.w / range_x
 
         # Shift data left, so that `min_x` would = 0, then scale so
         # that `max_x` would = width.
@@ -188,7 +222,7 @@ class Plot:
 
     @staticmethod
     def compute_screen_y(
-        canvas: TextCanvas, value: float, y: list[float]
+        canvas: TextCanvas, value: float, y: Sequence[float]
     ) -> int | None:
         """Compute Y position of a value on the canvas.
 
@@ -206,22 +240,68 @@ class Plot:
             >>> assert 0 == Plot.compute_screen_y(canvas, 10.0, y)
             >>> assert 10 == Plot.compute_screen_y(canvas, 0.0, y)
         """
-        if not y:
+        if len(y) == 0:
             return None
 
-        min_y: float = min(y)
-        max_y: float = max(y)
+        (min_y, max_y) = Plot._minmax(y)
+        return Plot._compute_screen_y_in_range(canvas, value, min_y, max_y)
+
+    @staticmethod
+    def _compute_screen_y_in_range(
+        canvas: TextCanvas, value: float, min_y: float, max_y: float
+    ) -> int:
+        """Like `compute_screen_y()`, with pre-computed bounds.
+
+        This lets callers that already know the bounds of Y avoid going
+        over the values again.
+        """
         range_y: float = max_y - min_y
 
-        try:
-            scale_y: float = canvas.h / range_y
-        except ZeroDivisionError:
+        if range_y == 0.0:
             return canvas.cy
+        scale_y: float = canvas.h / range_y
 
         # Shift data down, so that `min_y` would = 0, then scale so
         # that `max_y` would = height.
         return canvas.h - int((value - min_y) * scale_y)  # Y-axis is inverted.
 
+    @staticmethod
+    def _minmax(values: Sequence[float]) -> tuple[float, float]:
+        """Compute min and max of values in a single pass.
+
+        This is faster than calling `min()` and `max()` separately,
+        which would each go over the values.
+
+        Values must not be empty.
+
+        Examples:
+            >>> Plot._minmax([3.0, -1.0, 7.0, 2.0])
+            (-1.0, 7.0)
+        """
+        values_iter = iter(values)
+        min_value = max_value = next(values_iter)
+        for value in values_iter:
+            if value < min_value:
+                min_value = value
+            elif value > max_value:
+                max_value = value
+        return min_value, max_value
+
+    @staticmethod
+    def _is_sorted(values: Sequence[float]) -> bool:
+        """Check whether values are sorted in ascending order.
+
+        Values coming from `compute_function()` always are. Checking is
+        linear and done in C, which is much cheaper than sorting.
+
+        Examples:
+            >>> Plot._is_sorted([-1.0, 2.0, 2.0, 7.0])
+            True
+            >>> Plot._is_sorted([-1.0, 7.0, 2.0])
+            False
+        """
+        return all(map(operator.le, values, itertools.islice(values, 1, None)))
+
     @staticmethod
     def stroke_xy_axes_of_function(
         canvas: TextCanvas,
@@ -249,14 +329,13 @@ class Plot:
             ⠸⡀⠀⢰⡇⠀⠀⠀⠀⠸⡀⠀⢠⠃⠀
             ⠀⠱⡠⠃⡇⠀⠀⠀⠀⠀⠑⠤⠊⠀⠀
         """
-        # `stroke_(x|y)_axis_of_function()` methods would both compute
-        # the values of `f()`. It is more efficient to compute these
-        # values once, and use the regular `stroke_(x|y)_axis()`
-        # methods instead.
+        # Only the X axis needs the values of `f()`, the bounds of X
+        # are known upfront (see `_function_x_bounds()`).
         nb_values: int = canvas.screen.width
-        (x, y) = Plot.compute_function(from_x, to_x, nb_values, f)
+        (_, y) = Plot.compute_function(from_x, to_x, nb_values, f)
         Plot.stroke_x_axis(canvas, y)
-        Plot.stroke_y_axis(canvas, x)
+        (min_x, max_x) = Plot._function_x_bounds(from_x, to_x)
+        Plot._stroke_line_at_x_in_range(canvas, 0.0, min_x, max_x)
 
     @staticmethod
     def stroke_x_axis_of_function(
@@ -313,9 +392,8 @@ class Plot:
             ⡇⠀⠀⢸⠀⠀⠀⡇⠀⠀⢸⠀⠀⠀⢸
             ⡇⠀⠀⢸⠀⠀⠀⡇⠀⠀⢸⠀⠀⠀⢸
         """
-        nb_values: int = canvas.screen.width
-        (x, _) = Plot.compute_function(from_x, to_x, nb_values, f)
-        Plot.stroke_line_at_x(canvas, value, x)
+        (min_x, max_x) = Plot._function_x_bounds(from_x, to_x)
+        Plot._stroke_line_at_x_in_range(canvas, value, min_x, max_x)
 
     @staticmethod
     def stroke_line_at_y_of_function(
@@ -368,9 +446,24 @@ class Plot:
             >>> assert 14 == Plot.compute_screen_x_of_function(canvas, 0.0, -10.0, 10.0, f)
             >>> assert 29 == Plot.compute_screen_x_of_function(canvas, 10.0, -10.0, 10.0, f)
         """
-        nb_values: int = canvas.screen.width
-        (x, _) = Plot.compute_function(from_x, to_x, nb_values, f)
-        return Plot.compute_screen_x(canvas, value, x)
+        (min_x, max_x) = Plot._function_x_bounds(from_x, to_x)
+        return Plot._compute_screen_x_in_range(canvas, value, min_x, max_x)
+
+    @staticmethod
+    def _function_x_bounds(from_x: float, to_x: float) -> tuple[float, float]:
+        """Compute min and max of X values sampled for a function.
+
+        `compute_function()` always samples `from_x` and `to_x`, and
+        every X in-between lies within them. The bounds of X are thus
+        known upfront, and there is no need to compute `f()` at all.
+
+        Examples:
+            >>> Plot._function_x_bounds(7.0, -3.0)
+            (-3.0, 7.0)
+        """
+        if from_x <= to_x:
+            return from_x, to_x
+        return to_x, from_x
 
     @staticmethod
     def compute_screen_y_of_function(
@@ -397,7 +490,7 @@ class Plot:
         return Plot.compute_screen_y(canvas, value, y)
 
     @staticmethod
-    def line(canvas: TextCanvas, x: list[float], y: list[float]) -> None:
+    def line(canvas: TextCanvas, x: Sequence[float], y: Sequence[float]) -> None:
         """Plot line-joined points.
 
         The data is scaled to take up the entire canvas.
@@ -426,7 +519,7 @@ class Plot:
         Plot._plot(canvas, x, y, PlotType.LINE)
 
     @staticmethod
-    def scatter(canvas: TextCanvas, x: list[float], y: list[float]) -> None:
+    def scatter(canvas: TextCanvas, x: Sequence[float], y: Sequence[float]) -> None:
         """Plot scattered points.
 
         The data is scaled to take up the entire canvas.
@@ -457,41 +550,41 @@ class Plot:
     @staticmethod
     def _plot(
         canvas: TextCanvas,
-        x_vals: list[float],
-        y_vals: list[float],
+        x_vals: Sequence[float],
+        y_vals: Sequence[float],
         plot_type: PlotType,
     ) -> None:
-        if not x_vals or not y_vals:
+        if len(x_vals) == 0 or len(y_vals) == 0:
             return
 
-        pairs: list[tuple[float, float]] = list(zip(x_vals, y_vals))
-        if plot_type == PlotType.LINE:
-            # Sort by `x`
-            pairs.sort(key=lambda pair: pair[0])
-
-        min_x: float = min(x_vals)
-        max_x: float = max(x_vals)
-        range_x: float = max_x - min_x
+        (min_x, max_x) = Plot._minmax(x_vals)
+        (min_y, max_y) = Plot._minmax(y_vals)
+        Plot._plot_in_range(
+            canvas, x_vals, y_vals, plot_type, min_x, max_x, min_y, max_y
+        )
 
-        scale_x_is_infinite: bool = False
-        try:
-            scale_x: float = canvas.w / range_x
-        except ZeroDivisionError:
-            scale_x_is_infinite = True
-            scale_x = float("+inf")
+    @staticmethod
+    def _plot_in_range(
+        canvas: TextCanvas,
+        x_vals: Sequence[float],
+        y_vals: Sequence[float],
+        plot_type: PlotType,
+        min_x: float,
+        max_x: float,
+        min_y: float,
+        max_y: float,
+    ) -> None:
+        """Like `_plot()`, with pre-computed bounds.
 
-        min_y: float = min(y_vals)
-        max_y: float = max(y_vals)
+        Values must not be empty.
+        """
+        range_x: float = max_x - min_x
         range_y: float = max_y - min_y
 
-        scale_y_is_infinite: bool = False
-        try:
-            scale_y: float = canvas.h / range_y
-        except ZeroDivisionError:
-            scale_y_is_infinite = True
-            scale_y = float("+inf")
+        x_has_no_range: bool = range_x == 0.0
+        y_has_no_range: bool = range_y == 0.0
 
-        if scale_x_is_infinite or scale_y_is_infinite:
+        if x_has_no_range or y_has_no_range:
             # One or both axis have no range. This doesn't make sense
             # for plotting with auto-scale.
             return Plot._handle_axes_without_range(
@@ -499,35 +592,55 @@ class Plot:
                 x_vals,
                 y_vals,
                 plot_type,
-                scale_x_is_infinite,
-                scale_y_is_infinite,
+                x_has_no_range,
+                y_has_no_range,
             )
 
-        previous: tuple[int, int] | None = None  # For line plot.
-        for x, y in pairs:
-            # Shift data left so that `min_x` = 0, then scale so that
-            # `max_x` = width.
-            x = (x - min_x) * scale_x
-            x = int(x)
-
-            y = (y - min_y) * scale_y
-            y = canvas.h - y  # Y-axis is inverted.
-            y = int(y)
-
-            match plot_type:
-                case PlotType.LINE:
-                    pair = (x, y)
-                    if previous is not None:
-                        canvas.stroke_line(previous[0], previous[1], pair[0], pair[1])
-                    previous = pair
-                case PlotType.SCATTER:
-                    canvas.set_pixel(x, y, True)
+        # Points, in drawing order. Only line plots need the points to be
+        # sorted, others use the values as-is, without pairing them up.
+        # Values that are sorted already (e.g., computed from a function)
+        # are used as-is too.
+        xs: Sequence[float] = x_vals
+        ys: Sequence[float] = y_vals
+        if plot_type == PlotType.LINE and not Plot._is_sorted(x_vals):
+            # Sort by `x`. Sort indices rather than `(x, y)` pairs (like
+            # an "argsort"), and reorder both lists with them. This
+            # avoids building a tuple per point, and the key is a C
+            # callable, unlike a `lambda`.
+            nb_points: int = min(len(x_vals), len(y_vals))
+            order: list[int] = sorted(range(nb_points), key=x_vals.__getitem__)
+            xs = list(map(x_vals.__getitem__, order))
+            ys = list(map(y_vals.__getitem__, order))
+
+        scale_x: float = canvas.w / range_x
+        scale_y: float = canvas.h / range_y
+
+        # Transform all the points first, so that drawing only deals
+        # with screen coordinates.
+        #
+        # Shift data left so that `min_x` = 0, then scale so that
+        # `max_x` = width. Same for Y, but the Y-axis is inverted.
+        height: int = canvas.h
+        screen_xs: list[int] = [int((x - min_x) * scale_x) for x in xs]
+        screen_ys: list[int] = [int(height - (y - min_y) * scale_y) for y in ys]
+
+        # The plot type is the same for all points, dispatch once, and
+        # draw all the points in a single call.
+        match plot_type:
+            case PlotType.LINE:
+                # Points landing on the same pixel as the previous one
+                # are skipped by the polyline.
+                canvas.stroke_polyline(screen_xs, screen_ys)
+            case PlotType.SCATTER:
+                # Setting a pixel twice is cheaper than finding out it
+                # was set already, no need to de-duplicate points.
+                canvas.set_pixels(screen_xs, screen_ys, True)
 
     @staticmethod
     def _handle_axes_without_range(
         canvas: TextCanvas,
-        x_vals: list[float],
-        y_vals: list[float],
+        x_vals: Sequence[float],
+        y_vals: Sequence[float],
         plot_type: PlotType,
         x_has_no_range: bool,
         y_has_no_range: bool,
@@ -549,27 +662,38 @@ class Plot:
 
     @staticmethod
     def _draw_horizontally_centered_line(
-        canvas: TextCanvas, x_vals: list[float], plot_type: PlotType
+        canvas: TextCanvas, x_vals: Sequence[float], plot_type: PlotType
     ) -> None:
         match plot_type:
             case PlotType.LINE:
                 canvas.stroke_line(0, canvas.cy, canvas.w, canvas.cy)
             case PlotType.SCATTER:
-                for x_val in x_vals:
-                    if (x := Plot.compute_screen_x(canvas, x_val, x_vals)) is not None:
-                        canvas.set_pixel(x, canvas.cy, True)
+                # Like `compute_screen_x()`, but the scale is the same
+                # for every value, compute it once. X has a range,
+                # otherwise we wouldn't be here.
+                (min_x, max_x) = Plot._minmax(x_vals)
+                scale_x: float = canvas.w / (max_x - min_x)
+                screen_xs: list[int] = [int((x - min_x) * scale_x) for x in x_vals]
+                canvas.set_pixels(screen_xs, itertools.repeat(canvas.cy), True)
 
     @staticmethod
     def _draw_vertically_centered_line(
-        canvas: TextCanvas, y_vals: list[float], plot_type: PlotType
+        canvas: TextCanvas, y_vals: Sequence[float], plot_type: PlotType
     ) -> None:
         match plot_type:
             case PlotType.LINE:
                 canvas.stroke_line(canvas.cx, 0, canvas.cx, canvas.h)
             case PlotType.SCATTER:
-                for y_val in y_vals:
-                    if (y := Plot.compute_screen_y(canvas, y_val, y_vals)) is not None:
-                        canvas.set_pixel(canvas.cx, y, True)
+                # Like `compute_screen_y()`, but the scale is the same
+                # for every value, compute it once. Y has a range,
+                # otherwise we wouldn't be here.
+                (min_y, max_y) = Plot._minmax(y_vals)
+                scale_y: float = canvas.h / (max_y - min_y)
+                height: int = canvas.h
+                screen_ys: list[int] = [
+                    height - int((y - min_y) * scale_y) for y in y_vals
+                ]
+                canvas.set_pixels(itertools.repeat(canvas.cx), screen_ys, True)
 
     @staticmethod
     def function(
@@ -648,22 +772,26 @@ class Plot:
         # 1   2   3   4   5
         step: float = range / (nb_values - 1)
 
-        px: list[float] = []
-        py: list[T] = []
-
         # Always add first value.
-        px.append(from_x)
-        py.append(f(from_x))
-
+        px: list[float] = [from_x]
+
+        # Values in-between bounds. Steps are accumulated (`x += step`)
+        # rather than computed from their index, this yields the exact
+        # same values as the Rust implementation.
+        # The exact number of accumulated values is only known once done
+        # (rounding may add or drop one), so `px` can't be pre-sized.
+        # Bind `append()` once instead.
+        append = px.append
         x = from_x + step
         while x < to_x:
-            px.append(x)
-            py.append(f(x))
+            append(x)
             x += step
 
         # Always add last value.
-        px.append(to_x)
-        py.append(f(to_x))
+        append(to_x)
+
+        # Sample `f()` in one go, in a tight comprehension.
+        py: list[T] = [f(x) for x in px]
 
         return px, py
 
@@ -684,8 +812,16 @@ class Chart:
     HORIZONTAL_MARGIN: int = MARGIN_LEFT + MARGIN_RIGHT
     VERTICAL_MARGIN: int = MARGIN_TOP + MARGIN_BOTTOM
 
+    # `(threshold, divisor, suffix)`, from largest to smallest.
+    _NUMBER_SUFFIXES: tuple[tuple[float, float, str], ...] = (
+        (1_000_000_000_000.0, 1_000_000_000_000.0, "T"),
+        (1_000_000_000.0, 1_000_000_000.0, "B"),
+        (1_000_000.0, 1_000_000.0, "M"),
+        (10_000.0, 1000.0, "K"),
+    )
+
     @staticmethod
-    def line(canvas: TextCanvas, x: list[float], y: list[float]) -> None:
+    def line(canvas: TextCanvas, x: Sequence[float], y: Sequence[float]) -> None:
         """Render chart with a line plot.
 
         Examples:
@@ -712,7 +848,7 @@ class Chart:
         Chart._chart(canvas, x, y, PlotType.LINE)
 
     @staticmethod
-    def scatter(canvas: TextCanvas, x: list[float], y: list[float]) -> None:
+    def scatter(canvas: TextCanvas, x: Sequence[float], y: Sequence[float]) -> None:
         """Render chart with a scatter plot.
 
         Examples:
@@ -740,14 +876,18 @@ class Chart:
 
     @staticmethod
     def _chart(
-        canvas: TextCanvas, x: list[float], y: list[float], plot_type: PlotType
+        canvas: TextCanvas, x: Sequence[float], y: Sequence[float], plot_type: PlotType
     ) -> None:
-        if not x or not y:
+        if len(x) == 0 or len(y) == 0:
             return
         Chart._check_canvas_size(canvas)
-        Chart._plot_values(canvas, x, y, plot_type)
+        # Both the plot and the labels need the bounds of the values,
+        # go over the values only once.
+        (min_x, max_x) = Plot._minmax(x)
+        (min_y, max_y) = Plot._minmax(y)
+        Chart._plot_values(canvas, x, y, plot_type, min_x, max_x, min_y, max_y)
         Chart._stroke_plot_border(canvas)
-        Chart._draw_min_and_max_values(canvas, x, y)
+        Chart._draw_min_and_max_values(canvas, min_x, max_x, min_y, max_y)
 
     @staticmethod
     def _check_canvas_size(canvas: TextCanvas) -> None:
@@ -762,18 +902,21 @@ class Chart:
 
     @staticmethod
     def _plot_values(
-        canvas: TextCanvas, x: list[float], y: list[float], plot_type: PlotType
+        canvas: TextCanvas,
+        x: Sequence[float],
+        y: Sequence[float],
+        plot_type: PlotType,
+        min_x: float,
+        max_x: float,
+        min_y: float,
+        max_y: float,
     ) -> None:
         width = canvas.output.width - Chart.HORIZONTAL_MARGIN
         height = canvas.output.height - Chart.VERTICAL_MARGIN
 
         plot = TextCanvas(width, height)
 
-        match plot_type:
-            case PlotType.LINE:
-                Plot.line(plot, x, y)
-            case PlotType.SCATTER:
-                Plot.scatter(plot, x, y)
+        Plot._plot_in_range(plot, x, y, plot_type, min_x, max_x, min_y, max_y)
 
         canvas.draw_canvas(plot, Chart.MARGIN_LEFT * 2, Chart.MARGIN_TOP * 4)
 
@@ -791,58 +934,50 @@ class Chart:
 
     @staticmethod
     def _draw_min_and_max_values(
-        canvas: TextCanvas, x: list[float], y: list[float]
+        canvas: TextCanvas,
+        min_x_val: float,
+        max_x_val: float,
+        min_y_val: float,
+        max_y_val: float,
     ) -> None:
-        min_x: str = Chart._format_number(min(x))
-        max_x: str = Chart._format_number(max(x))
-        min_y: str = Chart._format_number(min(y))
-        max_y: str = Chart._format_number(max(y))
+        min_x: str = Chart._format_number(min_x_val)
+        max_x: str = Chart._format_number(max_x_val)
+        min_y: str = Chart._format_number(min_y_val)
+        max_y: str = Chart._format_number(max_y_val)
 
-        canvas.draw_text(
-            min_x,
-            Chart.MARGIN_LEFT - len(min_x),
-            canvas.output.height - Chart.MARGIN_TOP,
-        )
+        width: int = canvas.output.width
+        height: int = canvas.output.height
+        margin_left: int = Chart.MARGIN_LEFT
+        margin_top: int = Chart.MARGIN_TOP
+
+        canvas.draw_text(min_x, margin_left - len(min_x), height - margin_top)
         canvas.draw_text(
             max_x,
-            canvas.output.width - Chart.MARGIN_RIGHT + 2 - len(max_x),
-            canvas.output.height - Chart.MARGIN_TOP,
-        )
-        canvas.draw_text(
-            min_y,
-            Chart.MARGIN_LEFT - 2 - len(min_y),
-            canvas.output.height - Chart.MARGIN_TOP - 1,
-        )
-        canvas.draw_text(
-            max_y,
-            Chart.MARGIN_LEFT - 2 - len(max_y),
-            Chart.MARGIN_TOP - 1,
+            width - Chart.MARGIN_RIGHT + 2 - len(max_x),
+            height - margin_top,
         )
+        canvas.draw_text(min_y, margin_left - 2 - len(min_y), height - margin_top - 1)
+        canvas.draw_text(max_y, margin_left - 2 - len(max_y), margin_top - 1)
 
+    # Charts that are redrawn (e.g., animated) tend to show the same
+    # bounds over and over.
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _format_number(number: float) -> str:
-        precision = 1
-        suffix = ""
-        if abs(number) >= 1_000_000_000_000.0:
-            number /= 1_000_000_000_000.0
-            suffix = "T"
-        elif abs(number) >= 1_000_000_000.0:
-            number /= 1_000_000_000.0
-            suffix = "B"
-        elif abs(number) >= 1_000_000.0:
-            number /= 1_000_000.0
-            suffix = "M"
-        elif abs(number) >= 10_000.0:
-            number /= 1000.0
-            suffix = "K"
-        elif abs(number - round(number)) < 0.001:
-            precision = 0  # Close enough to being round for display.
-            if abs(number) < 0.000_1:
-                number = 0.0  # Prevent "-0".
-        elif abs(number) < 1.0:
-            precision = 4  # Sub-1 decimals matter a lot.
+        abs_number: float = abs(number)
 
-        return f"{number:.{precision}f}{suffix}"
+        for threshold, divisor, suffix in Chart._NUMBER_SUFFIXES:
+            if abs_number >= threshold:
+                return f"{number / divisor:.1f}{suffix}"
+
+        if abs(number - round(number)) < 0.001:
+            # Close enough to being round for display.
+            if abs_number < 0.000_1:
+                number = 0.0  # Prevent "-0".
+            return f"{number:.0f}"
+        if abs_number < 1.0:
+            return f"{number:.4f}"  # Sub-1 decimals matter a lot.
+        return f"{number:.1f}"
 
     @staticmethod
     def function(
@@ -93,11 +93,18 @@ class Color:
         self._is_bold: bool = False
         self._is_italic: bool = False
         self._is_underlined: bool = False
+        # Rendered escape sequence, reset whenever the color changes.
+        self._string: str | None = None
 
     def __eq__(self, other: Any) -> bool:
         return self.to_string() == other
 
     def to_string(self) -> str:
+        if self._string is None:
+            self._string = self._build_string()
+        return self._string
+
+    def _build_string(self) -> str:
         if self._is_empty():
             return PLACEHOLDER
 
@@ -129,14 +136,17 @@ class Color:
 
     def bold(self) -> Self:
         self._is_bold = True
+        self._string = None
         return self
 
     def italic(self) -> Self:
         self._is_italic = True
+        self._string = None
         return self
 
     def underline(self) -> Self:
         self._is_underlined = True
+        self._string = None
         return self
 
     def _format_display_attributes(self) -> str:
@@ -159,11 +169,13 @@ class Color:
     def _apply_color_rgb(self, red: int, green: int, blue: int) -> Self:
         self._mode = ColorMode.COLOR_RGB
         self._color_rgb = (red, green, blue)
+        self._string = None
         return self
 
     def _apply_bg_color_rgb(self, red: int, green: int, blue: int) -> Self:
         self._mode = ColorMode.COLOR_RGB
         self._bg_color_rgb = (red, green, blue)
+        self._string = None
         return self
 
     def rgb(self, red: int, green: int, blue: int) -> Self:
@@ -231,11 +243,13 @@ class Color:
     def _apply_color_4bit(self, color: int) -> Self:
         self._mode = ColorMode.COLOR_4BIT
         self._color_4bit = color
+        self._string = None
         return self
 
     def _apply_bg_color_4bit(self, color: int) -> Self:
         self._mode = ColorMode.COLOR_4BIT
         self._bg_color_4bit = color
+        self._string = None
         return self
 
     def _format_colors_4bit(self) -> str:
@@ -297,11 +311,13 @@ class Color:
     def _apply_color_8bit(self, color: int) -> Self:
         self._mode = ColorMode.COLOR_8BIT
         self._color_8bit = color
+        self._string = None
         return self
 
     def _apply_bg_color_8bit(self, color: int) -> Self:
         self._mode = ColorMode.COLOR_8BIT
         self._bg_color_8bit = color
+        self._string = None
         return self
 
     def _format_colors_8bit(self) -> str:
@@ -84,10 +84,12 @@ on the last row like so:
 [^1]: https://github.com/asciimoo/drawille
 """
 
+import io
+import itertools
 import math
 import os
 from dataclasses import dataclass
-from typing import Generator, Self
+from typing import Generator, Iterable, Self
 
 from .color import Color
 
@@ -118,6 +120,10 @@ BRAILLE_UNICODE_OFFSET_MAP: BrailleMap = (
     (0x4, 0x20),
     (0x40, 0x80),
 )
+# All 256 Braille chars, indexed by the sum of their dots' offsets.
+BRAILLE_CHARS: tuple[str, ...] = tuple(
+    chr(BRAILLE_UNICODE_0 + offset) for offset in range(0x100)
+)
 
 
 @dataclass
@@ -192,12 +198,17 @@ class TextCanvas:
 
         self.output: Surface = Surface(width, height)
         self.screen: Surface = Surface(width * 2, height * 4)
+        # Plain attributes for per-pixel bounds checks, one lookup each.
+        self._screen_width: int = self.screen.width
+        self._screen_height: int = self.screen.height
         self.buffer: PixelBuffer
         self.color_buffer: ColorBuffer = []
         self.text_buffer: TextBuffer = []
         self.is_inverted: bool = False
 
         self._color: Color = Color()
+        # Shared by all uncolored cells, instead of one `Color` per cell.
+        self._no_color: Color = Color()
 
         self._init_buffer()
 
@@ -210,12 +221,10 @@ class TextCanvas:
         return 0 <= x < self.output.width and 0 <= y < self.output.height
 
     def _check_screen_bounds(self, x: int, y: int) -> bool:
-        return 0 <= x < self.screen.width and 0 <= y < self.screen.height
+        return 0 <= x < self._screen_width and 0 <= y < self._screen_height
 
     def _init_buffer(self) -> None:
-        self.buffer = [
-            [OFF for _ in range(self.screen.width)] for _ in range(self.screen.height)
-        ]
+        self.buffer = [[OFF] * self.screen.width for _ in range(self.screen.height)]
 
     @classmethod
     def auto(cls) -> Self:
@@ -307,14 +316,20 @@ class TextCanvas:
         self._clear_text_buffer()
 
     def _clear_buffer(self) -> None:
-        for x, y in self.iter_buffer():
-            self.buffer[y][x] = False
+        self._fill_buffer(OFF)
+
+    def _fill_buffer(self, state: bool) -> None:
+        # Slice assignment fills each row in one go, and keeps the rows
+        # (and any references to them) alive.
+        row = [state] * self.screen.width
+        for buffer_row in self.buffer:
+            buffer_row[:] = row
 
     def _clear_color_buffer(self) -> None:
         if self.color_buffer:
-            for y, _ in enumerate(self.color_buffer):
-                for x, _ in enumerate(self.color_buffer[y]):
-                    self.color_buffer[y][x] = Color()
+            row = [self._no_color] * self.output.width
+            for color_buffer_row in self.color_buffer:
+                color_buffer_row[:] = row
 
     def _clear_text_buffer(self) -> None:
         if self.text_buffer:
@@ -331,8 +346,7 @@ class TextCanvas:
             `fill()` is not affected by inverted mode, it works on a
             lower level.
         """
-        for x, y in self.iter_buffer():
-            self.buffer[y][x] = True
+        self._fill_buffer(ON)
 
     def invert(self) -> None:
         """Invert drawing mode.
@@ -397,8 +411,7 @@ class TextCanvas:
 
     def _init_color_buffer(self) -> None:
         self.color_buffer = [
-            [Color() for _ in range(self.output.width)]
-            for _ in range(self.output.height)
+            [self._no_color] * self.output.width for _ in range(self.output.height)
         ]
 
     def get_pixel(self, x: int, y: int) -> bool | None:
@@ -446,11 +459,81 @@ class TextCanvas:
             else:
                 self._decolor_pixel(x, y)
 
+    def set_pixels(self, xs: Iterable[int], ys: Iterable[int], state: bool) -> None:
+        """Set the state of multiple screen pixels at once.
+
+        This is equivalent to calling `set_pixel()` for each pair of
+        coordinates, but the checks that do not depend on the pixel
+        (inversion, color) are only done once.
+
+        Note:
+            Coordinates outside the screen bounds are ignored.
+
+        Args:
+            xs (Iterable[int]): Screen Xs (high resolution).
+            ys (Iterable[int]): Screen Ys (high resolution), paired
+                with `xs`. Extra coordinates in the longest of the two
+                are ignored.
+            state (bool): `True` means _on_, `False` means _off_.
+
+        Examples:
+            >>> canvas = TextCanvas(3, 1)
+            >>> canvas.set_pixels(range(6), [0, 1, 2, 3, 2, 1], True)
+            >>> print(canvas, end="")
+            ⠑⢄⠔
+        """
+        width: int = self._screen_width
+        height: int = self._screen_height
+
+        if self.is_inverted:
+            state = not state
+
+        buffer: PixelBuffer = self.buffer
+
+        if not self.is_colorized:
+            for x, y in zip(xs, ys):
+                if 0 <= x < width and 0 <= y < height:
+                    buffer[y][x] = state
+            return
+
+        color_buffer: ColorBuffer = self.color_buffer
+        color: Color = self._color if state is True else self._no_color
+        for x, y in zip(xs, ys):
+            if 0 <= x < width and 0 <= y < height:
+                buffer[y][x] = state
+                color_buffer[y // 4][x // 2] = color
+
+    def _set_pixels_in_bounds(
+        self, xs: Iterable[int], ys: Iterable[int], state: bool
+    ) -> None:
+        """Like `set_pixels()`, without checking the screen bounds.
+
+        Only use this if all coordinates are known to be within the
+        screen bounds, e.g., points of a line whose two ends are within
+        the screen. Coordinates outside the screen bounds could raise an
+        `IndexError`, or wrap around with negative indices.
+        """
+        if self.is_inverted:
+            state = not state
+
+        buffer: PixelBuffer = self.buffer
+
+        if not self.is_colorized:
+            for x, y in zip(xs, ys):
+                buffer[y][x] = state
+            return
+
+        color_buffer: ColorBuffer = self.color_buffer
+        color: Color = self._color if state is True else self._no_color
+        for x, y in zip(xs, ys):
+            buffer[y][x] = state
+            color_buffer[y // 4][x // 2] = color
+
     def _color_pixel(self, x: int, y: int) -> None:
         self.color_buffer[y // 4][x // 2] = self._color
 
     def _decolor_pixel(self, x: int, y: int) -> None:
-        self.color_buffer[y // 4][x // 2] = Color()
+        self.color_buffer[y // 4][x // 2] = self._no_color
 
     def draw_text(self, text: str, x: int, y: int) -> None:
         """Draw text onto the canvas.
@@ -531,45 +614,41 @@ class TextCanvas:
             and each canvas column becomes a single character in each
             line. What you would expect. It can be printed as-is.
         """
-        res: str = ""
-        for i, pixel_block in enumerate(self._iter_buffer_by_blocks_lrtb()):
-            x: int = i % self.output.width
-            y: int = i // self.output.width
-
-            # Text layer.
-            if (text_char := self._get_text_char(x, y)) != "":
-                res += text_char
-            # Pixel layer.
+        # Check which layers are active once, instead of for every cell.
+        is_colorized: bool = self.is_colorized
+        is_textual: bool = self.is_textual
+
+        # Colored cells repeat a lot (same color, same char), format
+        # each combination only once. Colors are keyed by identity, it
+        # is stable for the duration of the call since the color buffer
+        # holds a reference to them.
+        colored_chars: dict[tuple[int, str], str] = {}
+
+        # Write everything into a single buffer, no intermediate strings.
+        res: io.StringIO = io.StringIO()
+        write = res.write
+        for y, braille_row in enumerate(self._iter_braille_rows_tb()):
+            # Pixels only, the row is ready as-is.
+            if not is_colorized and not is_textual:
+                res.writelines(braille_row)
             else:
-                braille_char: str = self._pixel_block_to_braille_char(pixel_block)
-                res += self._color_pixel_char(x, y, braille_char)
-
-            # If end of line is reached, go to next line.
-            if (i + 1) % self.output.width == 0:
-                res += "\n"
-        return res
-
-    def _get_text_char(self, x: int, y: int) -> str:
-        if self.is_textual:
-            return self.text_buffer[y][x]
-        return ""
-
-    @staticmethod
-    def _pixel_block_to_braille_char(pixel_block: PixelBlock) -> str:
-        braille_char: BrailleChar = BRAILLE_UNICODE_0
-        # Iterate over individual pixels to turn them on or off.
-        for y, _ in enumerate(pixel_block):
-            for x, _ in enumerate(pixel_block[y]):
-                if pixel_block[y][x] is ON:
-                    braille_char += BRAILLE_UNICODE_OFFSET_MAP[y][x]
-        # Convert Unicode integer value to string.
-        return chr(braille_char)
-
-    def _color_pixel_char(self, x: int, y: int, pixel_char: str) -> str:
-        if self.is_colorized:
-            color: Color = self.color_buffer[y][x]
-            return color.format(pixel_char)
-        return pixel_char
+                for x, braille_char in enumerate(braille_row):
+                    # Text layer.
+                    if is_textual and (text_char := self.text_buffer[y][x]) != "":
+                        write(text_char)
+                    # Pixel layer.
+                    elif is_colorized:
+                        color: Color = self.color_buffer[y][x]
+                        key = (id(color), braille_char)
+                        if (colored_char := colored_chars.get(key)) is None:
+                            colored_char = color.format(braille_char)
+                            colored_chars[key] = colored_char
+                        write(colored_char)
+                    else:
+                        write(braille_char)
+            # End of line is reached, go to next line.
+            write("\n")
+        return res.getvalue()
 
     def _iter_buffer_by_blocks_lrtb(self) -> Generator[PixelBlock, None, None]:
         """Advance block by block (2x4), left-right, top-bottom."""
@@ -582,10 +661,49 @@ class TextCanvas:
                     (self.buffer[y + 3][x + 0], self.buffer[y + 3][x + 1]),
                 )
 
+    def _iter_braille_rows_tb(self) -> Generator[list[str], None, None]:
+        """Advance row of blocks by row of blocks, top-bottom.
+
+        Blocks are converted to Braille chars from their packed codes.
+        """
+        for codes in self._iter_block_codes_tb():
+            yield list(map(BRAILLE_CHARS.__getitem__, codes))
+
+    def _iter_block_codes_tb(self) -> Generator[list[int], None, None]:
+        """Advance row of blocks by row of blocks, top-bottom.
+
+        Each block (2x4) is packed into a single `int` (0-255) directly
+        from the buffer rows, without going through intermediate pixel
+        blocks. Pixels are `bool`s, so multiplying them by their offset
+        either keeps (`ON`) or cancels (`OFF`) the offset. Offsets are
+        the Braille dots' values, so the code of a block is also its
+        offset from `BRAILLE_UNICODE_0`.
+        """
+        (
+            (offset_0_0, offset_0_1),
+            (offset_1_0, offset_1_1),
+            (offset_2_0, offset_2_1),
+            (offset_3_0, offset_3_1),
+        ) = BRAILLE_UNICODE_OFFSET_MAP
+        for y in range(0, self.screen.height, 4):
+            row_0, row_1, row_2, row_3 = self.buffer[y : y + 4]
+            yield [
+                row_0[x] * offset_0_0
+                + row_0[x + 1] * offset_0_1
+                + row_1[x] * offset_1_0
+                + row_1[x + 1] * offset_1_1
+                + row_2[x] * offset_2_0
+                + row_2[x + 1] * offset_2_1
+                + row_3[x] * offset_3_0
+                + row_3[x + 1] * offset_3_1
+                for x in range(0, self.screen.width, 2)
+            ]
+
     def iter_buffer(self) -> Generator[tuple[int, int], None, None]:
+        xs = range(self.screen.width)
         for y in range(self.screen.height):
-            for x in range(self.screen.width):
-                yield x, y
+            # Pairs are built by `zip()` in C, not one by one in Python.
+            yield from zip(xs, itertools.repeat(y))
 
     # Implementation of drawing primitives.
 
@@ -604,32 +722,124 @@ class TextCanvas:
         """
         self._bresenham_line(x1, y1, x2, y2)
 
+    def stroke_polyline(self, xs: Iterable[int], ys: Iterable[int]) -> None:
+        """Stroke lines joining consecutive points.
+
+        This is equivalent to calling `stroke_line()` for each pair of
+        consecutive points, in a single call. Consecutive points that
+        fall in the same column are drawn as a single vertical line.
+
+        Args:
+            xs (Iterable[int]): Screen Xs (high resolution).
+            ys (Iterable[int]): Screen Ys (high resolution), paired
+                with `xs`. Extra coordinates in the longest of the two
+                are ignored.
+
+        Examples:
+            >>> canvas = TextCanvas(15, 5)
+            >>> canvas.stroke_polyline([0, 10, 20, 29], [19, 0, 19, 0])
+            >>> print(canvas, end="")
+            ⠀⠀⠀⠀⡰⠱⡀⠀⠀⠀⠀⠀⠀⠀⡜
+            ⠀⠀⠀⡰⠁⠀⠱⡀⠀⠀⠀⠀⠀⡜⠀
+            ⠀⠀⡰⠁⠀⠀⠀⠱⡀⠀⠀⠀⡜⠀⠀
+            ⠀⡰⠁⠀⠀⠀⠀⠀⠱⡀⠀⡜⠀⠀⠀
+            ⡰⠁⠀⠀⠀⠀⠀⠀⠀⠱⡜⠀⠀⠀⠀
+        """
+        points = zip(xs, ys)
+        first_point: tuple[int, int] | None = next(points, None)
+        if first_point is None:
+            return
+
+        (previous_x, previous_y) = first_point
+        # A lone point is a line of length zero.
+        self.set_pixel(previous_x, previous_y, True)
+
+        # Consecutive points in the same column form a continuous
+        # vertical path, which covers exactly the span between its
+        # lowest and highest points. Track that span, and stroke it
+        # once when the path leaves the column.
+        bresenham_line = self._bresenham_line
+        (span_min_y, span_max_y) = (previous_y, previous_y)
+        for x, y in points:
+            if x == previous_x:
+                if y < span_min_y:
+                    span_min_y = y
+                elif y > span_max_y:
+                    span_max_y = y
+                previous_y = y
+                continue
+            if span_min_y != span_max_y:
+                bresenham_line(previous_x, span_min_y, previous_x, span_max_y)
+            bresenham_line(previous_x, previous_y, x, y)
+            (previous_x, previous_y) = (x, y)
+            (span_min_y, span_max_y) = (y, y)
+        if span_min_y != span_max_y:
+            bresenham_line(previous_x, span_min_y, previous_x, span_max_y)
+
     def _bresenham_line(self, x1: int, y1: int, x2: int, y2: int) -> None:
         """Stroke line using Bresenham's line algorithm."""
+        width: int = self._screen_width
+        height: int = self._screen_height
+
+        # Trivially reject lines that lie entirely on the outer side of
+        # one of the screen's edges (like Cohen-Sutherland does). None
+        # of their pixels can be visible, don't walk them for nothing.
+        if (
+            (x1 < 0 and x2 < 0)
+            or (x1 >= width and x2 >= width)
+            or (y1 < 0 and y2 < 0)
+            or (y1 >= height and y2 >= height)
+        ):
+            return
+
         dx = abs(x2 - x1)
         sx = 1 if x1 < x2 else -1
         dy = -abs(y2 - y1)
         sy = 1 if y1 < y2 else -1
         error = dx + dy
 
-        # Treat vertical and horizontal lines as special cases.
+        # Treat vertical and horizontal lines as special cases. Clip
+        # them to the screen, out-of-bounds pixels would be ignored
+        # anyway. Their constant coordinate is within the screen, or
+        # they would have been rejected above.
         if dx == 0:
             x = x1
-            from_y = min(y1, y2)
-            to_y = max(y1, y2)
-            for y in range(from_y, to_y + 1):
-                self.set_pixel(x, y, True)
+            from_y = max(min(y1, y2), 0)
+            to_y = min(max(y1, y2), height - 1)
+            self._set_pixels_in_bounds(
+                itertools.repeat(x), range(from_y, to_y + 1), True
+            )
             return
         elif dy == 0:
             y = y1
-            from_x = min(x1, x2)
-            to_x = max(x1, x2)
-            for x in range(from_x, to_x + 1):
-                self.set_pixel(x, y, True)
+            from_x = max(min(x1, x2), 0)
+            to_x = min(max(x1, x2), width - 1)
+            if not self.is_colorized:
+                # The line is a run of pixels in a single row of the
+                # buffer, replace it in one go.
+                state: bool = not self.is_inverted
+                self.buffer[y][from_x : to_x + 1] = [state] * (to_x - from_x + 1)
+                return
+            self._set_pixels_in_bounds(
+                range(from_x, to_x + 1), itertools.repeat(y), True
+            )
             return
 
+        # Points between two ends within the screen are within the
+        # screen too, they don't need to be checked one by one.
+        is_in_bounds: bool = (
+            0 <= x1 < width
+            and 0 <= x2 < width
+            and 0 <= y1 < height
+            and 0 <= y2 < height
+        )
+
+        # Compute all points first, and set them in one batch.
+        xs: list[int] = []
+        ys: list[int] = []
         while True:
-            self.set_pixel(x1, y1, True)
+            xs.append(x1)
+            ys.append(y1)
             if x1 == x2 and y1 == y2:
                 break
             e2 = 2 * error
@@ -643,6 +853,10 @@ class TextCanvas:
                     break  # pragma: no cover
                 error = error + dx
                 y1 = y1 + sy
+        if is_in_bounds:
+            self._set_pixels_in_bounds(xs, ys, True)
+        else:
+            self.set_pixels(xs, ys, True)
 
     def stroke_rect(self, x: int, y: int, width: int, height: int) -> None:
         """Stroke rectangle.